@@ -1,22 +1,42 @@
 """This module defines the FloorPlan class for representing and working with
 floor plans."""
 
+import os
 import re
+import mmap
 import logging
-from collections import deque
-from typing import Optional
+from functools import cached_property
+from operator import itemgetter
+
+import numpy as np
+from scipy.ndimage import label
+
+# UTF-8 byte order mark, skipped when present at the start of a floor plan file
+_UTF8_BOM = b"\xef\xbb\xbf"
+
+# Pattern matching a room label, capturing the room name enclosed in parentheses
+_ROOM_RE = re.compile(r"\(([^)]+)\)")
+
+# Grid byte standing in for any non-ASCII character; it is never a wall, chair or label
+_NON_ASCII_CELL = 0x80
+
+# Entry of the chair lookup table for bytes that are not a chair
+_NOT_A_CHAIR = 0xFF
+
+# Structuring element connecting each cell to its up, down, left and right neighbours
+_FOUR_CONNECTED = np.array([[0, 1, 0], [1, 1, 1], [0, 1, 0]], dtype=bool)
 
 
 class FloorPlanError(Exception):
     """Custom exception class for FloorPlan related errors."""
 
 
-class FloorPlan:
+class FloorPlan:  # pylint: disable=too-many-instance-attributes
     """Represents a floor plan and provides methods for working with it."""
 
     def __init__(self, file_path: str, chair_types: set[str], wall_separators: set[str]):
         """Initialize the FloorPlan object by reading and padding the floor
-        plan from a file, and initializing the visited matrix.
+        plan from a file, and indexing its room labels.
 
         Args:
             file_path (str): Path to the file containing the floor plan.
@@ -29,10 +49,10 @@ class FloorPlan:
 
         try:
             logging.debug(f"Reading and padding the floor plan from {file_path}")
-            self.floor_plan: list[list[str]] = self._read_and_pad_floor_plan(file_path)
+            self.grid, self._non_ascii_rows = self._read_and_pad_floor_plan(file_path)
 
             # Immediately set rows and cols based on the the padded floor plan dimensions
-            self.rows, self.cols = len(self.floor_plan), len(self.floor_plan[0])
+            self.rows, self.cols = self.grid.shape
             logging.debug(f"Floor plan dimensions: {self.rows} rows, {self.cols} columns")
 
         except IOError as e:
@@ -45,19 +65,59 @@ class FloorPlan:
                 "Failed to initialize FloorPlan: The padded floor plan is an empty matrix."
             )
 
+        # Resolve the name of every label at its opening parenthesis, in row-major order.
+        # Positions are encoded as x * cols + y, indexing the flattened floor plan.
+        self.label_names: dict[int, str] = {
+            x * self.cols + start: name
+            for x, spans in enumerate(self._index_room_labels())
+            for start, _, name in spans
+        }
+        self._label_positions = np.fromiter(self.label_names, dtype=np.intp)
+
         # Initialize instance variables
-        self.visited: list[list[bool]] = [[False] * self.cols for _ in range(self.rows)]
         self.wall_separators: set[str] = wall_separators
         self.chair_types: set[str] = chair_types
-        self.room_mappings: dict[str, dict[str, int]] = {}
+        self.room_mappings: dict[str, np.ndarray] = {}
+
+        # Chair types in a fixed order; a chair's position in this list is its chair index
+        self.chair_chars_ordered: list[str] = sorted(chair_types)
+
+        # (chair index, chair type) pairs in output order, sorted once for every room
+        self._sorted_chairs: list[tuple[int, str]] = sorted(
+            enumerate(self.chair_chars_ordered), key=itemgetter(1), reverse=True
+        )
+
+        # 256-entry lookup tables classifying every byte value of the grid:
+        # wall_lut flags wall bytes, chair_lut maps chair bytes to their chair index.
+        self.wall_lut = np.zeros(256, dtype=np.uint8)
+        self.wall_lut[[ord(c) for c in wall_separators]] = 1
+        self.chair_lut = np.full(256, _NOT_A_CHAIR, dtype=np.uint8)
+        self.chair_lut[[ord(c) for c in self.chair_chars_ordered]] = np.arange(
+            len(self.chair_chars_ordered)
+        )
 
         # logging
-        logging.debug("Visited matrix:")
-        for row in self.visited:
-            logging.debug(" ".join("X" if cell else "." for cell in row))
         logging.debug(f"Wall separators: {self.wall_separators}")
         logging.debug(f"Chair types: {self.chair_types}")
 
+    @cached_property
+    def floor_plan(self) -> list[list[str]]:
+        """A copy of the floor plan as a list of rows of characters, with the
+        same shape as the grid.
+
+        floor_plan[x][y] is the character of cell grid[x, y]; rows holding non-ASCII
+        characters are taken from their decoded text. The copy is built on first access and
+        cached; it does not reflect changes made to it by callers back into the grid.
+        """
+        return [
+            (
+                list(self._non_ascii_rows[x].ljust(self.cols))
+                if x in self._non_ascii_rows
+                else list(row.tobytes().decode("ascii"))
+            )
+            for x, row in enumerate(self.grid)
+        ]
+
     def _validate_inputs(self, chair_types: set[str], wall_separators: set[str]):
         """Validates the input sets for chair types and wall separators to
         ensure they are not empty.
@@ -73,8 +133,8 @@ class FloorPlan:
                 that cannot be crossed.
 
         Raises:
-            ValueError: If either 'chair_types' or 'wall_separators' is empty,
-                indicating invalid input.
+            ValueError: If either 'chair_types' or 'wall_separators' is empty, or if any of
+                their elements is not a single ASCII character, indicating invalid input.
         """
         # Validate that the chair_types set is not empty
         if not chair_types:
@@ -88,30 +148,39 @@ class FloorPlan:
             )
             raise ValueError("Wall separators cannot be empty.")
 
-    def _read_and_pad_floor_plan(self, file_path: str) -> list[list[str]]:
+        # The grid stores one byte per cell, so every character must be a single ASCII character
+        for char in chair_types | wall_separators:
+            if len(char) != 1 or not char.isascii():
+                logging.error(
+                    f"Validation Error in _validate_inputs: {char!r} is not a single ASCII "
+                    "character."
+                )
+                raise ValueError(f"Invalid character {char!r}: expected a single ASCII character.")
+
+    def _read_and_pad_floor_plan(self, file_path: str) -> tuple[np.ndarray, dict[int, str]]:
         """Reads a floor plan from a file, removing trailing whitespace from
         each line, and pads each line with spaces to ensure all have the same
         length.
 
-        Uses 'utf-8-sig' encoding to correctly handle files with a UTF-8 BOM.
+        The file is memory-mapped and stored as a contiguous matrix of bytes, one byte per
+        character. The file must be valid UTF-8, and a leading UTF-8 BOM is skipped.
 
         Args:
             file_path (str): The path to the file containing the floor plan.
 
         Returns:
-            A list of lists, where each inner list represents a row in the floor plan
-            with equal length, padded with spaces to ensure all have the same length.
+            A tuple containing a 2D numpy.uint8 array of shape (rows, cols), where each row
+            represents a row in the floor plan padded with spaces to ensure all have the same
+            length, and the decoded text of the rows holding non-ASCII characters, by row.
         """
         try:
-            with open(file_path, encoding="utf-8-sig") as f:
-                # Create a list of lists from the file, stripping trailing whitespace
-                floor_plan = [list(line.rstrip()) for line in f]
-
-                # Determine the maximum length of rows for padding
-                max_length = max(len(row) for row in floor_plan)
+            with open(file_path, "rb") as f:
+                # An empty file cannot be memory-mapped and yields an empty matrix
+                if os.fstat(f.fileno()).st_size == 0:
+                    return np.empty((0, 0), dtype=np.uint8), {}
 
-                # Pad each row to ensure uniform length across the floor plan
-                return [row + [" "] * (max_length - len(row)) for row in floor_plan]
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    return self._split_and_pad_lines(mm)
 
         except FileNotFoundError as e:
             raise FileNotFoundError(f"File '{file_path}' not found.") from e
@@ -119,205 +188,226 @@ class FloorPlan:
         except Exception as e:
             raise FloorPlanError(f"Error reading floor plan from '{file_path}': {e}") from e
 
-    def _print_floor_plan(self) -> None | str:
-        logging.debug("=" * self.rows * 2)
-        for row in self.visited:
-            logging.debug(" ".join("X" if cell else "." for cell in row))
-        logging.debug("%" * self.rows * 2)
-
-    def _is_visitable(self, cell: tuple[int, int]) -> bool:
-        """Determines if a given cell in the floor plan is visitable.
+    @staticmethod
+    def _locate_rows(buf: np.ndarray) -> tuple[list[int], list[int]]:
+        """Locates the rows of a floor plan in its raw bytes.
 
         Args:
-            cell (tuple[int, int]): The (x, y) coordinates of the cell to check.
+            buf (np.ndarray): The contents of the floor plan file as a 1D numpy.uint8 array.
 
         Returns:
-            bool: True if the cell is visitable, False otherwise.
+            The start and end offsets of every row, excluding line breaks and a leading
+            UTF-8 BOM.
         """
-        x, y = cell
-        return (
-            0 <= x < self.rows
-            and 0 <= y < self.cols
-            and not self.visited[x][y]
-            and self.floor_plan[x][y] not in self.wall_separators
-        )
+        # Locate the line breaks to determine the span of each row. As with universal
+        # newlines, a "\r" not followed by "\n" also ends a row.
+        breaks = np.flatnonzero(buf == 0x0A)
+        carriage_returns = np.flatnonzero(buf == 0x0D)
+        if carriage_returns.size:
+            before_newline = carriage_returns + 1 < buf.size
+            before_newline[before_newline] = buf[carriage_returns[before_newline] + 1] == 0x0A
+            breaks = np.union1d(breaks, carriage_returns[~before_newline])
+        starts = [0] + (breaks + 1).tolist()
+        ends = breaks.tolist() + [buf.size]
+
+        # A trailing line break does not start a new row
+        if starts[-1] == ends[-1]:
+            starts.pop()
+            ends.pop()
+
+        if buf[: len(_UTF8_BOM)].tobytes() == _UTF8_BOM:
+            starts[0] = len(_UTF8_BOM)
+
+        return starts, ends
 
     @staticmethod
-    def get_room_name(row_str: str, y: int) -> str | None:
-        """Extracts a room name from a row string based on the horizontal
-        position (y) using regex.
+    def _split_and_pad_lines(data: mmap.mmap) -> tuple[np.ndarray, dict[int, str]]:
+        """Splits the raw bytes of a floor plan into rows, removing trailing
+        whitespace from each row, and copies them into a space-padded matrix.
 
-        Searches for the nearest pair of parentheses surrounding the y position and
-        extracts the substring enclosed within. If the position is not within a valid
-        room name boundary or if parentheses are not properly matched, returns None.
+        The rows are located with a single vectorized scan for line breaks, and each ASCII
+        row is copied into the matrix straight from a view of the data. Rows holding other
+        characters are decoded as UTF-8 one at a time, and each of their non-ASCII
+        characters takes a single _NON_ASCII_CELL cell, keeping the columns aligned.
 
         Args:
-            row_str (str): The string representation of the floor plan's row.
-            y (int): The horizontal position (column index) within the row.
+            data (mmap.mmap): The memory-mapped contents of the floor plan file.
 
         Returns:
-            str or None: The extracted room name if found, otherwise None.
+            A tuple containing a 2D numpy.uint8 array of shape (rows, cols), padded with
+            spaces, and the decoded text of the rows holding non-ASCII characters, by row.
+
+        Raises:
+            UnicodeDecodeError: If a row is not valid UTF-8.
         """
+        # A view of the mapping; it is released when this method returns
+        buf = np.frombuffer(data, dtype=np.uint8)
+
+        starts, ends = FloorPlan._locate_rows(buf)
+
+        # Decode the rows holding non-ASCII bytes, if the file has any past its BOM
+        non_ascii_rows: dict[int, str] = {}
+        if buf[starts[0] :].max(initial=0) >= 0x80:
+            for i, (start, end) in enumerate(zip(starts, ends)):
+                row = data[start:end]
+                if not row.isascii():
+                    non_ascii_rows[i] = row.decode("utf-8").rstrip()
+
+        # Determine the length of each row once trailing whitespace is stripped
+        lengths = [
+            len(non_ascii_rows[i]) if i in non_ascii_rows else len(data[start:end].rstrip())
+            for i, (start, end) in enumerate(zip(starts, ends))
+        ]
 
-        # Compile a regex pattern to find all substrings enclosed in parentheses
-        pattern = re.compile(r"\(([^)]+)\)")
+        # Copy each row into a space-padded matrix to ensure uniform length,
+        # one cell per character for the decoded rows
+        grid = np.full((len(starts), max(lengths, default=0)), ord(" "), dtype=np.uint8)
+        for i, (start, length) in enumerate(zip(starts, lengths)):
+            if i in non_ascii_rows:
+                code_points = np.frombuffer(non_ascii_rows[i].encode("utf-32-le"), np.uint32)
+                grid[i, :length] = np.minimum(code_points, _NON_ASCII_CELL)
+            else:
+                grid[i, :length] = buf[start : start + length]
 
-        # Find all matches of the pattern in the row string
-        matches = pattern.finditer(row_str)
+        return grid, non_ascii_rows
 
-        for match in matches:
+    def _print_floor_plan(self, areas: np.ndarray) -> None:
+        """Logs the area matrix at debug level, marking non-wall cells with X.
 
-            # Check if the given y position falls within the current match's span
-            if match.start() <= y < match.end():
+        Returns immediately when debug logging is disabled, so that no row is formatted.
 
-                # Return the matched group (room name) without parentheses
-                return match.group(1)
+        Args:
+            areas (np.ndarray): The area id of every cell, 0 for walls.
+        """
+        if not logging.getLogger().isEnabledFor(logging.DEBUG):
+            return
 
-        # Return None if no valid room name is found surrounding the y position
-        return None
+        logging.debug("=" * self.rows * 2)
+        for row in areas:
+            logging.debug(" ".join("X" if cell else "." for cell in row))
+        logging.debug("%" * self.rows * 2)
 
-    def _bfs(
-        self,
-        start_cell: tuple[int, int],
-    ) -> tuple[Optional[str], dict[str, int]]:
-        """Explores the floor plan from a starting cell using Breadth-First
-        Search (BFS) to count chairs by type and identify the room name,
-        considering specified wall_separators to identify walls and chair
-        types.
+    def _index_room_labels(self) -> list[list[tuple[int, int, str]]]:
+        """Scans the floor plan once for room labels.
 
-        Args:
-            start_cell (tuple[int, int]): The starting cell coordinates (x, y) as a tuple.
+        Only the rows containing an opening parenthesis are converted to text and
+        searched; they are found with a single vectorized pass over the grid. Rows holding
+        non-ASCII characters are searched in their decoded text, so room names keep them.
 
         Returns:
-            A tuple containing the room name (str or None) and a dictionary of chairs found,
-            mapping chair types (str) to their counts (int). Each chair type is initialized
-            with a count of 0.
+            A list with one entry per row, holding the (start, end, name) span of each room
+            label in that row, ordered by start column. The span covers the parentheses.
+        """
+        row_rooms: list[list[tuple[int, int, str]]] = [[] for _ in range(self.rows)]
 
-        Raises:
-            InvalidCellContentError: If a cell's content is neither a recognized chair type
-            nor a wall separator.
+        for x in np.flatnonzero((self.grid == ord("(")).any(axis=1)).tolist():
+            text = self._non_ascii_rows.get(x) or self.grid[x].tobytes().decode("ascii")
+            row_rooms[x] = [
+                (match.start(), match.end(), match.group(1)) for match in _ROOM_RE.finditer(text)
+            ]
+
+        return row_rooms
+
+    def _count_chairs_by_area(self, areas: np.ndarray, num_areas: int) -> np.ndarray:
+        """Counts every chair type in every area of the labelled floor plan
+        at once.
+
+        Args:
+            areas (np.ndarray): The area id of every cell, 0 for walls.
+            num_areas (int): The number of areas in areas.
+
+        Returns:
+            A numpy.uint32 array of shape (num_areas + 1, number of chair types), holding at
+            [area, chair index] the count of that chair type in that area. Row 0 counts the
+            chairs on wall cells and is always zero.
         """
+        num_chairs = len(self.chair_chars_ordered)
 
-        # Return immediately if the floor plan is empty, indicating there's nothing to explore.
-        if not self.floor_plan or not self.floor_plan[0]:
-            return None, []
-
-        # Initialize the queue with the starting cell and prepare containers for results.
-        queue = deque([start_cell])
-        chairs: dict[str, int] = {chair: 0 for chair in self.chair_types}
-        area_name: Optional[str] = None
-
-        # Mark the starting cell as visited.
-        self.visited[start_cell[0]][start_cell[1]] = True
-
-        # Continue exploring until there are no more cells to visit in a room.
-        while queue:
-            x, y = queue.popleft()  # Current cell being visited
-            cell_value = self.floor_plan[x][y]  # Value of the current cell
-
-            # If the current cell's value is in chair_types, count it to the chairs list.
-            if cell_value in self.chair_types:
-                chairs[cell_value] += 1
-
-            # If we haven't identified the area name yet,
-            # and the cell indicates a room name start, extract the name.
-            elif not area_name and cell_value == "(":
-                # Convert the current row to a string and attempt to extract the room name
-                area_name = self.get_room_name("".join(self.floor_plan[x]), y)
-
-            # Explore adjacent cells in all four directions (up, down, left, right).
-            for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                nx, ny = (
-                    x + dx,
-                    y + dy,
-                )  # Calculate coordinates of the next cell to visit
-
-                # If the next cell is visitable (within bounds, not visited,
-                # and not a wall), mark it as visited and add to the queue.
-                if self._is_visitable((nx, ny)):
-                    self.visited[nx][ny] = True
-                    queue.append((nx, ny))
-
-        # Return the discovered room name (if any) and the list of chairs
-        # found during the exploration.
-        return area_name, chairs
+        # Locate the chair cells and the chair index of each one
+        chair_indices = self.chair_lut[self.grid]
+        is_chair = chair_indices != _NOT_A_CHAIR
+
+        # Count the (area, chair index) pairs in a single pass
+        counts = np.bincount(
+            areas[is_chair].astype(np.intp) * num_chairs + chair_indices[is_chair],
+            minlength=(num_areas + 1) * num_chairs,
+        )
+        return counts.reshape(num_areas + 1, num_chairs).astype(np.uint32)
 
     def parse_floor_plan(self):
         """Parses the entire floor plan to find all rooms and count chair types
         within each room.
 
+        The non-wall cells are split into 4-connected areas with a connected-component
+        labelling, and an area belongs to the room whose label it holds.
+
         Stores the result in self.room_mappings as {"room_name":
-        {"chair_type": count}}.
+        chair_counts}, where chair_counts holds the count of each chair type
+        at its chair index (see chair_chars_ordered).
         """
 
         logging.debug("Starting to parse the floor plan.")
 
-        # Reinitialize the visited matrix to ensure a fresh start for parsing.
-        self.visited = [[False] * self.cols for _ in range(self.rows)]
+        # Label the 4-connected areas of non-wall cells; wall cells are left as area 0.
+        areas, num_areas = label(self.wall_lut[self.grid] == 0, structure=_FOUR_CONNECTED)
+        chairs_by_area = self._count_chairs_by_area(areas, num_areas)
 
-        # Iterate over each cell in the floor plan
-        for x in range(self.rows):
-            for y in range(self.cols):
-                if self._is_visitable((x, y)):
-                    self._explore_cell(x, y)
+        # Name each area after the first room label it holds, in row-major order.
+        area_names: dict[int, str] = {}
+        label_areas = areas.ravel()[self._label_positions]
+        for area, name in zip(label_areas.tolist(), self.label_names.values()):
+            if area:
+                area_names.setdefault(area, name)
+        logging.debug("Skipping %d unnamed areas.", num_areas - len(area_names))
 
+        # Reinitialize the room mappings and add the chairs of every named area.
+        self.room_mappings = {}
+        for area, area_name in area_names.items():
+            self._explore_area(area, area_name, chairs_by_area[area])
+
+        self._print_floor_plan(areas)
         logging.debug("Finished parsing the floor plan.")
 
-    def _explore_cell(self, x: int, y: int) -> None:
-        """Explore a single cell in the floor plan, updating room mappings if a
-        room is discovered.
+    def _explore_area(self, area: int, area_name: str, chairs: np.ndarray) -> None:
+        """Add the chairs of a single area of the floor plan to its room,
+        discovering the room if needed.
 
         Args:
-            x (int): The x-coordinate of the cell.
-            y (int): The y-coordinate of the cell.
+            area (int): The id of the area.
+            area_name (str): The name of the room the area belongs to.
+            chairs (np.ndarray): The counts of each chair type in the area, by chair index.
         """
-        # Skip over cells that have been visited or are marked as wall separators.
-        if not self.visited[x][y] and self.floor_plan[x][y] not in self.wall_separators:
-            logging.debug(f"Exploring from cell ({x}, {y}).")
-
-            # Perform BFS from each unvisited cell that is not a wall to discover rooms
-            area_name, chairs = self._bfs((x, y))
-
-            if area_name:
-                if area_name in self.room_mappings:
-                    logging.debug(f"Updating room: {area_name} with chairs: {chairs}")
-
-                    # Merge chair counts if the room was already discovered
-                    for chair, count in chairs.items():
-                        self.room_mappings[area_name][chair] = (
-                            self.room_mappings[area_name].get(chair, 0) + count
-                        )
-                else:
-                    logging.debug(f"Discovered new room: {area_name} with chairs: {chairs}")
-                    self.room_mappings[area_name] = chairs
-            else:
-                logging.debug(f"Encountered an unnamed area starting at cell ({x}, {y}); skipping.")
+        logging.debug("Exploring area %d.", area)
+
+        # Look the room up once; its counts array is updated in place below.
+        room_chairs = self.room_mappings.get(area_name)
 
-        logging.debug(f"Last explored cell ({x}, {y}).")
-        self._print_floor_plan()
+        if room_chairs is not None:
+            logging.debug("Updating room: %s with chairs: %s", area_name, chairs)
 
-    def _format_chair_counts(self, chair_counts: dict) -> str:
+            # Merge chair counts if the room was already discovered
+            room_chairs += chairs
+        else:
+            logging.debug("Discovered new room: %s with chairs: %s", area_name, chairs)
+            self.room_mappings[area_name] = chairs.copy()
+
+        logging.debug("Last explored area %d.", area)
+
+    def _format_chair_counts(self, chair_counts: np.ndarray) -> str:
         """Formats the chair counts into a sorted, comma-separated string,
-        ensuring that all chair types defined in the class, as well as those
-        found in specific rooms, are included in the output. Chair types not
-        found in the room will have a count of 0.
+        ensuring that all chair types defined in the class are included in the
+        output. Chair types not found in the room will have a count of 0.
 
         Args:
-            chair_counts (dict): A dictionary mapping chair types to their counts in a room.
+            chair_counts (np.ndarray): The counts of each chair type in a room, indexed by
+                chair index (see chair_chars_ordered).
 
         Returns:
             str: A formatted string of chair counts, sorted alphabetically by chair type.
         """
-        # Ensure all chair types are included, even if their count is zero, for consistent output.
-        all_chair_types = sorted(set(self.chair_types) | set(chair_counts.keys()), reverse=True)
-
-        # Construct the output string by iterating over all chair types.
-        # For each chair type, retrieve its count from chair_counts,
-        # defaulting to 0 if not found. This ensures that all known chair
-        # types are included in the output, even if not present in the room.
-        formatted_chair_counts = [
-            f"{chair}: {chair_counts.get(chair, 0)}" for chair in all_chair_types
-        ]
+        # Construct the output string from every chair type, including those with a count of 0.
+        counts = chair_counts.tolist()
+        formatted_chair_counts = [f"{chair}: {counts[i]}" for i, chair in self._sorted_chairs]
 
         # Join the individual chair count strings with commas to form the final output.
         return ", ".join(formatted_chair_counts)
@@ -326,13 +416,12 @@ class FloorPlan:
         """Returns a string representation of the room names stored in
         room_mappings and their chair counts, in alphabetical order, including
         a total count of chairs at the beginning."""
-        # Initialize total chairs dictionary with zeros for all chair types.
-        total_chairs = {chair: 0 for chair in self.chair_types}
+        # Initialize total chair counts with zeros for all chair types.
+        total_chairs = np.zeros(len(self.chair_chars_ordered), dtype=np.uint32)
 
         # Calculate total chair counts across all rooms.
         for chairs in self.room_mappings.values():
-            for chair, count in chairs.items():
-                total_chairs[chair] += count
+            total_chairs += chairs
 
         # Format the total counts.
         total_counts_str = self._format_chair_counts(total_chairs)
@@ -42,7 +42,7 @@ def main(file_path: str, separators: set, chair_chars: set, log_level: str) -> N
         floor_plan.parse_floor_plan()
         # Print the sorted room names and their chair counts
         print(floor_plan.get_room_names_sorted())
-    except FloorPlanError as e:
+    except (FloorPlanError, ValueError) as e:
         logging.error(f"Failed to process floor plan: {e}")
         sys.exit(1)
 
@@ -112,3 +112,144 @@ def test_invalid_floor_plan(example_file_path):
 
     with pytest.raises(FloorPlanError):
         FloorPlan(file_path, chair_types, wall_separators)
+
+
+def test_floor_plan_line_endings_and_bom(tmp_path):
+    """Test that a UTF-8 BOM and Windows line endings do not alter the parsed floor plan.
+
+    Args:
+        tmp_path (pathlib.Path): Temporary directory provided by pytest.
+    """
+    file_path = tmp_path / "bom_crlf.txt"
+    file_path.write_bytes(b"\xef\xbb\xbf+-----+\r\n|(a) P|\r\n|  C  |\r\n+-----+\r\n")
+    chair_types = {"C", "S", "P", "W"}
+    wall_separators = {"+", "-", "|", "/", "\\"}
+
+    floor_plan = FloorPlan(str(file_path), chair_types, wall_separators)
+    floor_plan.parse_floor_plan()
+
+    assert (floor_plan.rows, floor_plan.cols) == (4, 7)
+    assert floor_plan.floor_plan[2] == list("|  C  |")
+    expected_output = """\
+total:
+W: 0, S: 0, P: 1, C: 1
+a:
+W: 0, S: 0, P: 1, C: 1"""
+    assert floor_plan.get_room_names_sorted() == expected_output
+
+
+def test_floor_plan_carriage_return_line_endings(tmp_path):
+    """Test that a lone carriage return ends a row, as in classic Mac line endings.
+
+    Args:
+        tmp_path (pathlib.Path): Temporary directory provided by pytest.
+    """
+    file_path = tmp_path / "cr.txt"
+    file_path.write_bytes(b"+-----+\r|(a) W|\r|  P  |\r+-----+\r")
+    chair_types = {"C", "S", "P", "W"}
+    wall_separators = {"+", "-", "|", "/", "\\"}
+
+    floor_plan = FloorPlan(str(file_path), chair_types, wall_separators)
+    floor_plan.parse_floor_plan()
+
+    assert (floor_plan.rows, floor_plan.cols) == (4, 7)
+    expected_output = """\
+total:
+W: 1, S: 0, P: 1, C: 0
+a:
+W: 1, S: 0, P: 1, C: 0"""
+    assert floor_plan.get_room_names_sorted() == expected_output
+
+
+def test_floor_plan_utf8_rows(tmp_path):
+    """Test that the floor_plan rows and room names decode UTF-8 characters.
+
+    Args:
+        tmp_path (pathlib.Path): Temporary directory provided by pytest.
+    """
+    file_path = tmp_path / "utf8.txt"
+    file_path.write_text("+--------+\n|(café) W|\n+--------+\n", encoding="utf-8")
+    chair_types = {"C", "S", "P", "W"}
+    wall_separators = {"+", "-", "|", "/", "\\"}
+
+    floor_plan = FloorPlan(str(file_path), chair_types, wall_separators)
+    floor_plan.parse_floor_plan()
+
+    rows = floor_plan.floor_plan
+    assert rows[1] == list("|(café) W|")
+    assert len(rows[1]) == floor_plan.cols
+    assert floor_plan.floor_plan is rows
+    expected_output = """\
+total:
+W: 1, S: 0, P: 0, C: 0
+café:
+W: 1, S: 0, P: 0, C: 0"""
+    assert floor_plan.get_room_names_sorted() == expected_output
+
+
+def test_floor_plan_multibyte_label_beside_shared_wall(tmp_path):
+    """Test that multi-byte characters in a label do not shift the wall shared by two rooms.
+
+    Args:
+        tmp_path (pathlib.Path): Temporary directory provided by pytest.
+    """
+    file_path = tmp_path / "multibyte_label.txt"
+    file_path.write_text(
+        "+------+------+\n|(séé) |(b)   |\n|   W  |  P   |\n+------+------+\n", encoding="utf-8"
+    )
+    chair_types = {"C", "S", "P", "W"}
+    wall_separators = {"+", "-", "|", "/", "\\"}
+
+    floor_plan = FloorPlan(str(file_path), chair_types, wall_separators)
+    floor_plan.parse_floor_plan()
+
+    assert (floor_plan.rows, floor_plan.cols) == (4, 15)
+    expected_output = """\
+total:
+W: 1, S: 0, P: 1, C: 0
+b:
+W: 0, S: 0, P: 1, C: 0
+séé:
+W: 1, S: 0, P: 0, C: 0"""
+    assert floor_plan.get_room_names_sorted() == expected_output
+
+
+def test_floor_plan_stray_parenthesis(tmp_path):
+    """Test that an opening parenthesis outside a room label does not hide the room's label.
+
+    Args:
+        tmp_path (pathlib.Path): Temporary directory provided by pytest.
+    """
+    file_path = tmp_path / "stray_parenthesis.txt"
+    file_path.write_text("+--------+\n| ( W    |\n|   (b) W|\n+--------+\n")
+    chair_types = {"C", "S", "P", "W"}
+    wall_separators = {"+", "-", "|", "/", "\\"}
+
+    floor_plan = FloorPlan(str(file_path), chair_types, wall_separators)
+    floor_plan.parse_floor_plan()
+
+    expected_output = """\
+total:
+W: 2, S: 0, P: 0, C: 0
+b:
+W: 2, S: 0, P: 0, C: 0"""
+    assert floor_plan.get_room_names_sorted() == expected_output
+
+
+@pytest.mark.parametrize(
+    "content", [b"+-----+\n|(\xff) W|\n+-----+\n", b"+---+\n|\xff W|\n+---+\n"]
+)
+def test_invalid_utf8_floor_plan(tmp_path, content):
+    """Test that a floor plan that is not valid UTF-8 is rejected, inside or outside a label.
+
+    Args:
+        tmp_path (pathlib.Path): Temporary directory provided by pytest.
+        content (bytes): The raw contents of the floor plan file.
+    """
+    file_path = tmp_path / "invalid_utf8.txt"
+    file_path.write_bytes(content)
+    chair_types = {"C", "S", "P", "W"}
+    wall_separators = {"+", "-", "|", "/", "\\"}
+
+    with pytest.raises(FloorPlanError):
+        FloorPlan(str(file_path), chair_types, wall_separators)